@@ -1,14 +1,21 @@
+from functools import lru_cache
+
 from dotenv import load_dotenv
 from pydantic_settings import BaseSettings
 
-load_dotenv()
-
 
 class Settings(BaseSettings):
     MONGODB_URI: str = "mongodb://localhost:27017"
     MONGODB_NAME: str = "test_db"
     MONGODB_COLLECTION_NAME: str = "test_collection"
+    MONGODB_MAX_POOL_SIZE: int = 50
+    MONGODB_MIN_POOL_SIZE: int = 5
+    MONGODB_TIMEOUT_MS: int = 2000
     OPENAI_API_KEY: str
 
 
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Load the environment and build the settings on first use."""
+    load_dotenv()
+    return Settings()
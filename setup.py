@@ -18,7 +18,7 @@ setup(
     packages=find_packages(where="src"),
     package_dir={"": "src"},
     install_requires=read_requirements("requirements.txt"),
-    python_requires=">=3.8",
+    python_requires=">=3.10",
     author="Stefany Bedoya",
     description="Generative recipe generator",
     long_description=(
@@ -1,6 +1,8 @@
 import uvicorn
+import asyncio
 import logging
-from config import settings
+from contextlib import asynccontextmanager
+from config import get_settings
 
 from src.schemas.recipes_schemas import UserRequest
 from src.llm.recipe_generator import RecipeGenerator
@@ -9,23 +11,112 @@ from src.llm.output_validator import RecipeValidator
 from src.llm.openai_llm import OpenAILLM
 from src.db.mongodb_handler import MongoDBHandler
 from src.schemas.ingredient_schemas import UserPreferences
-from fastapi import FastAPI, HTTPException
-
+from fastapi import Depends, FastAPI, HTTPException, Request
+from fastapi.responses import ORJSONResponse
+from pymongo import errors
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-app = FastAPI()
+# MongoDB's ObjectId is not JSON serializable and is never used by the API.
+PREFERENCES_PROJECTION = {"_id": 0}
+RECIPE_INPUTS_PROJECTION = {
+    "_id": 0,
+    "available_ingredients": 1,
+    "liked_ingredients": 1,
+    "disliked_ingredients": 1,
+}
+# Only read for documents stored without the split name lists.
+INGREDIENTS_PROJECTION = {"_id": 0, "ingredients": 1}
+# Validation is CPU-bound; larger batches run off the event loop.
+THREADED_VALIDATION_THRESHOLD = 10
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Create shared resources on startup and release them on shutdown."""
+    settings = get_settings()
+    app.state.mongo = MongoDBHandler(
+        uri=settings.MONGODB_URI,
+        db_name=settings.MONGODB_NAME,
+        collection_name=settings.MONGODB_COLLECTION_NAME,
+        max_pool_size=settings.MONGODB_MAX_POOL_SIZE,
+        min_pool_size=settings.MONGODB_MIN_POOL_SIZE,
+        timeout_ms=settings.MONGODB_TIMEOUT_MS,
+    )
+    try:
+        try:
+            await app.state.mongo.create_indexes()
+        except errors.DuplicateKeyError as e:
+            # Older data may hold duplicate user_ids; serve it unindexed
+            # rather than refusing to start.
+            logger.error(
+                f"Unique user_id index not created; remove duplicate "
+                f"user_id documents and restart: {e}"
+            )
+        app.state.llm = OpenAILLM(
+            model_name="gpt-4", api_key=settings.OPENAI_API_KEY, temperature=0
+        )
+        app.state.recipe_generator = RecipeGenerator(
+            app.state.llm, RECIPE_PARSER, RECIPE_PROMPT
+        )
+        yield
+    finally:
+        await app.state.mongo.close_connection()
+
+
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
+
+
+def _split_ingredient_preferences(
+    user_preferences: dict,
+) -> tuple[list[str], list[str]]:
+    """
+    Return the liked and disliked ingredient names of a stored document.
+
+    Documents written before the names were stored alongside the
+    preferences only have the raw `ingredients` list, so the names are
+    rebuilt from it when the stored lists are missing.
+
+    Args:
+        user_preferences (dict): The stored user preferences document.
+
+    Returns:
+        tuple[list[str], list[str]]: The liked and disliked ingredient names.
+    """
+    ingredients = user_preferences.get("ingredients", [])
+    liked_ingredients = user_preferences.get("liked_ingredients")
+    if liked_ingredients is None:
+        liked_ingredients = [
+            ingredient["name"]
+            for ingredient in ingredients
+            if ingredient.get("like")
+        ]
+    disliked_ingredients = user_preferences.get("disliked_ingredients")
+    if disliked_ingredients is None:
+        disliked_ingredients = [
+            ingredient["name"]
+            for ingredient in ingredients
+            if not ingredient.get("like")
+        ]
+    return liked_ingredients, disliked_ingredients
+
+
+def get_mongo_handler(request: Request) -> MongoDBHandler:
+    """Return the MongoDB handler created by the application lifespan."""
+    return request.app.state.mongo
 
-mongo_handler = MongoDBHandler(
-    uri=settings.MONGODB_URI,
-    db_name=settings.MONGODB_NAME,
-    collection_name=settings.MONGODB_COLLECTION_NAME,
-)
+
+def get_recipe_generator(request: Request) -> RecipeGenerator:
+    """Return the recipe generator created by the application lifespan."""
+    return request.app.state.recipe_generator
 
 
 @app.post("/insert_user_preferences/")
-async def insert_user_preferences(preferences: UserPreferences):
+async def insert_user_preferences(
+    preferences: UserPreferences,
+    mongo_handler: MongoDBHandler = Depends(get_mongo_handler),
+):
     """
     Insert user preferences data into MongoDB.
 
@@ -53,7 +144,10 @@ async def insert_user_preferences(preferences: UserPreferences):
 
 
 @app.post("/get_user_preferences/")
-async def get_user_preferences(request: UserRequest):
+async def get_user_preferences(
+    request: UserRequest,
+    mongo_handler: MongoDBHandler = Depends(get_mongo_handler),
+):
     """
     Retrieve user preferences from MongoDB by user ID.
     """
@@ -61,11 +155,13 @@ async def get_user_preferences(request: UserRequest):
     logger.info(f"Fetching user preferences for user_id: {user_id}...")
 
     try:
-        preferences = await mongo_handler.fetch_data({"user_id": user_id})
+        preferences = await mongo_handler.fetch_one(
+            {"user_id": user_id}, PREFERENCES_PROJECTION
+        )
 
         if preferences:
             logger.info(f"Preferences found for user_id {user_id}")
-            return {"preferences": preferences[0]}
+            return {"preferences": preferences}
         else:
             logger.warning(f"No preferences found for user_id {user_id}")
             raise HTTPException(
@@ -84,7 +180,11 @@ async def get_user_preferences(request: UserRequest):
 
 
 @app.post("/generate_recipes/")
-async def generate_recipes_for_user(request: UserRequest):
+async def generate_recipes_for_user(
+    request: UserRequest,
+    mongo_handler: MongoDBHandler = Depends(get_mongo_handler),
+    recipe_generator: RecipeGenerator = Depends(get_recipe_generator),
+):
     """
     Retrieve user data from MongoDB asynchronously and generate recipes.
     """
@@ -92,26 +192,29 @@ async def generate_recipes_for_user(request: UserRequest):
     logger.info(f"Fetching preferences for user_id: {user_id}...")
 
     try:
-        user_data = await mongo_handler.fetch_data({"user_id": user_id})
+        user_preferences = await mongo_handler.fetch_one(
+            {"user_id": user_id}, RECIPE_INPUTS_PROJECTION
+        )
 
-        if not user_data:
+        if not user_preferences:
             logger.warning(f"No data found for user_id: {user_id}")
             raise HTTPException(status_code=404, detail="User data not found.")
 
-        user_preferences = user_data[0]
-        ingredients = user_preferences.get("ingredients", [])
+        if (
+            user_preferences.get("liked_ingredients") is None
+            or user_preferences.get("disliked_ingredients") is None
+        ):
+            stored_ingredients = await mongo_handler.fetch_one(
+                {"user_id": user_id}, INGREDIENTS_PROJECTION
+            )
+            user_preferences.update(stored_ingredients or {})
+
         available_ingredients = user_preferences.get(
             "available_ingredients", []
         )
-        liked_ingredients = [ing["name"] for ing in ingredients if ing["like"]]
-        disliked_ingredients = [
-            ing["name"] for ing in ingredients if not ing["like"]
-        ]
-
-        llm = OpenAILLM(
-            model_name="gpt-4", api_key=settings.OPENAI_API_KEY, temperature=0
+        liked_ingredients, disliked_ingredients = (
+            _split_ingredient_preferences(user_preferences)
         )
-        recipe_generator = RecipeGenerator(llm, RECIPE_PARSER, RECIPE_PROMPT)
 
         available_ingredients_list = [
             f"{ing['name']} ({ing['quantity']})"
@@ -125,30 +228,32 @@ async def generate_recipes_for_user(request: UserRequest):
         }
 
         logger.info("Generating recipes based on user preferences...")
-        output = await recipe_generator.generate_recipes(
+        recipes = {}
+        async for recipe in recipe_generator.stream_recipes(
             inputs["available_ingredients"],
             inputs["liked_ingredients"],
             inputs["disliked_ingredients"],
-        )
-        logger.info(f"Recipes generated: {output}")
-        logger.info(f"Type recipes generated: {type(output)}")
+        ):
+            recipes[f"recipe_{len(recipes) + 1}"] = recipe.model_dump()
+        logger.debug("Recipes generated: %s", recipes)
 
         recipe_validator = RecipeValidator(
             disliked_ingredients=disliked_ingredients,
             available_ingredients=available_ingredients,
             min_ingredients_required=3,
         )
-        valid_recipes = recipe_validator.validate_recipes(output["recipes"])
-
-        if valid_recipes:
-            logger.info(f"Generated {len(valid_recipes)} valid recipes.")
-            for idx, recipe in enumerate(valid_recipes, start=1):
-                logger.info(f"Recipe {idx}: {recipe}")
+        if len(recipes) > THREADED_VALIDATION_THRESHOLD:
+            valid_recipes = await asyncio.to_thread(
+                recipe_validator.validate_recipes, recipes
+            )
         else:
-            logger.warning("No valid recipes were generated.")
+            valid_recipes = recipe_validator.validate_recipes(recipes)
 
         if valid_recipes:
             logger.info(f"Generated {len(valid_recipes)} valid recipes.")
+            if logger.isEnabledFor(logging.DEBUG):
+                for idx, recipe in enumerate(valid_recipes, start=1):
+                    logger.debug("Recipe %d: %s", idx, recipe)
             return {"recipes": valid_recipes}
         else:
             logger.warning("No valid recipes were generated.")
@@ -161,12 +266,5 @@ async def generate_recipes_for_user(request: UserRequest):
         )
 
 
-@app.on_event("shutdown")
-def shutdown_db():
-    """Close MongoDB connection on shutdown."""
-    mongo_handler.close_connection()
-    logger.info("MongoDB connection closed.")
-
-
 if __name__ == "__main__":
     uvicorn.run(app, host="0.0.0.0", port=8000)
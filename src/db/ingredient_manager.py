@@ -1,6 +1,7 @@
 import logging
 from typing import Dict, List
-from pymongo import MongoClient, errors
+from motor.motor_asyncio import AsyncIOMotorCollection
+from pymongo import errors
 from src.schemas.ingredient_schemas import (
     UserPreferences,
     Ingredient,
@@ -10,36 +11,33 @@ logger = logging.getLogger(__name__)
 
 
 class IngredientManager:
-    def __init__(self, uri: str, db_name: str, collection_name: str):
+    def __init__(self, collection: AsyncIOMotorCollection):
         """
-        Initializes the MongoDB connection for managing user ingredient
-        preferences.
+        Manages user ingredient preferences on an existing Motor collection.
+
+        Pass the collection of an already connected client (for example
+        `MongoDBHandler.collection`) so both share one connection pool.
 
         Args:
-            uri (str): MongoDB connection URI.
-            db_name (str): Database name.
-            collection_name (str): Collection name.
+            collection (AsyncIOMotorCollection): Collection holding the
+                user preferences.
+        """
+        self.collection = collection
+
+    async def create_indexes(self) -> None:
+        """
+        Creates the unique `user_id` index. Call once at application
+        startup rather than on every instantiation.
         """
         try:
-            self.client: MongoClient = MongoClient(uri)
-            self.db = self.client[db_name]
-            self.collection = self.db[collection_name]
-            logger.info(
-                "Connected to database: %s, collection: %s",
-                db_name,
-                collection_name,
-            )
-            self.collection.create_index("user_id", unique=True)
-        except errors.ConnectionFailure as e:
-            logger.error(f"Failed to connect to MongoDB: {e}")
-            raise
-        except Exception as e:
-            logger.error(
-                f"Unexpected error while initializing IngredientManager: {e}"
-            )
+            await self.collection.create_index("user_id", unique=True)
+        except errors.PyMongoError as e:
+            logger.error(f"MongoDB error occurred while creating indexes: {e}")
             raise
 
-    def save_preferences(self, preferences: UserPreferences) -> Dict[str, str]:
+    async def save_preferences(
+        self, preferences: UserPreferences
+    ) -> Dict[str, str]:
         """
         Saves or updates a user's ingredient preferences in the database.
 
@@ -55,7 +53,7 @@ class IngredientManager:
             self._validate_preferences(preferences.ingredients)
             preference_data = preferences.model_dump()
 
-            result = self.collection.update_one(
+            result = await self.collection.update_one(
                 {"user_id": preference_data["user_id"]},
                 {"$set": preference_data},
                 upsert=True,
@@ -93,15 +91,14 @@ class IngredientManager:
         """
         seen_ingredients: Dict[str, bool] = {}
         for ingredient in ingredients:
-            name = ingredient.name.lower()
-            if name in seen_ingredients:
-                if seen_ingredients[name] != ingredient.like:
-                    raise ValueError(
-                        f"Contradictory preference for ingredient: {ingredient.name}"
-                    )
-            seen_ingredients[name] = ingredient.like
-
-    def get_preferences(self, user_id: str) -> Dict[str, List[str]]:
+            name = ingredient.name.casefold()
+            previous = seen_ingredients.setdefault(name, ingredient.like)
+            if previous != ingredient.like:
+                raise ValueError(
+                    f"Contradictory preference for ingredient: {ingredient.name}"
+                )
+
+    async def get_preferences(self, user_id: str) -> Dict[str, List[str]]:
         """
         Retrieves the user's ingredient preferences from the database.
 
@@ -112,21 +109,18 @@ class IngredientManager:
             Dict[str, List[str]]: A dictionary with 'liked_ingredients' and 'disliked_ingredients'.
         """
         try:
-            preferences = self.collection.find_one({"user_id": user_id})
+            preferences = await self.collection.find_one(
+                {"user_id": user_id},
+                {"liked_ingredients": 1, "disliked_ingredients": 1, "_id": 0},
+            )
             if preferences:
-                liked = [
-                    ingredient["name"]
-                    for ingredient in preferences.get("liked_ingredients", [])
-                ]
-                disliked = [
-                    ingredient["name"]
-                    for ingredient in preferences.get(
-                        "disliked_ingredients", []
-                    )
-                ]
                 return {
-                    "liked_ingredients": liked,
-                    "disliked_ingredients": disliked,
+                    "liked_ingredients": preferences.get(
+                        "liked_ingredients", []
+                    ),
+                    "disliked_ingredients": preferences.get(
+                        "disliked_ingredients", []
+                    ),
                 }
             else:
                 logger.info(f"No preferences found for user_id: {user_id}")
@@ -142,7 +136,7 @@ class IngredientManager:
             )
             raise
 
-    def delete_preferences(self, user_id: str) -> bool:
+    async def delete_preferences(self, user_id: str) -> bool:
         """
         Deletes the user's ingredient preferences from the database.
 
@@ -153,7 +147,7 @@ class IngredientManager:
             bool: True if the preferences were deleted, False if not found.
         """
         try:
-            result = self.collection.delete_one({"user_id": user_id})
+            result = await self.collection.delete_one({"user_id": user_id})
             if result.deleted_count > 0:
                 logger.info(f"Preferences deleted for user_id: {user_id}")
                 return True
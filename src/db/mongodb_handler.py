@@ -1,24 +1,43 @@
 import logging
-from typing import Union, List, Dict, Any
+from typing import Union, List, Dict, Any, Optional
 from motor.motor_asyncio import AsyncIOMotorClient
 from pymongo import errors
 from bson import ObjectId
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
 class MongoDBHandler:
-    def __init__(self, uri: str, db_name: str, collection_name: str):
+    def __init__(
+        self,
+        uri: str,
+        db_name: str,
+        collection_name: str,
+        max_pool_size: int = 50,
+        min_pool_size: int = 5,
+        timeout_ms: int = 2000,
+    ):
         """Initialize MongoDB connection.
 
+        Create the handler from within the running event loop (e.g. the
+        FastAPI lifespan) so the client binds to that loop.
+
         Args:
             uri (str): MongoDB connection URI.
             db_name (str): Database name.
             collection_name (str): Collection name.
+            max_pool_size (int): Maximum number of pooled connections.
+            min_pool_size (int): Connections kept open while idle.
+            timeout_ms (int): Server selection timeout in milliseconds.
         """
         try:
-            self.client: AsyncIOMotorClient = AsyncIOMotorClient(uri)
+            self.client: AsyncIOMotorClient = AsyncIOMotorClient(
+                uri,
+                maxPoolSize=max_pool_size,
+                minPoolSize=min_pool_size,
+                serverSelectionTimeoutMS=timeout_ms,
+                uuidRepresentation="standard",
+            )
             self.db = self.client[db_name]
             self.collection = self.db[collection_name]
             logger.info(
@@ -33,23 +52,30 @@ class MongoDBHandler:
     ) -> Union[ObjectId, List[ObjectId]]:
         """Insert a single or multiple documents into the collection.
 
+        Batches are inserted unordered, so a duplicate `user_id` does not
+        stop the remaining documents from being written.
+
         Args:
             data (dict | list[dict]): Document(s) to insert.
 
         Returns:
-            ObjectId | list[ObjectId]: Inserted document ID(s).
+            ObjectId | list[ObjectId]: Inserted document ID(s). For a batch
+            with write errors, only the IDs of the documents that were
+            written are returned.
         """
         try:
             if isinstance(data, list):
                 for item in data:
-                    await self._validate_document(item)
-                insert_many_result = await self.collection.insert_many(data)
+                    self._validate_document(item)
+                insert_many_result = await self.collection.insert_many(
+                    data, ordered=False
+                )
                 logger.info(
                     f"Inserted {len(insert_many_result.inserted_ids)} documents."
                 )
                 return insert_many_result.inserted_ids
             else:
-                await self._validate_document(data)
+                self._validate_document(data)
                 insert_one_result = await self.collection.insert_one(data)
                 logger.info(
                     f"Inserted document with ID: {insert_one_result.inserted_id}"
@@ -58,9 +84,20 @@ class MongoDBHandler:
         except errors.DuplicateKeyError:
             logger.error("Duplicate user_id detected. Ensure uniqueness.")
             raise ValueError("Duplicate user_id detected.")
-        except errors.BulkWriteError:
-            logger.error("Bulk insert error: Duplicate user_id detected.")
-            raise ValueError("Duplicate user_id detected in batch insert.")
+        except errors.BulkWriteError as e:
+            write_errors = e.details.get("writeErrors", [])
+            failed_indexes = {error["index"] for error in write_errors}
+            for error in write_errors:
+                logger.error(
+                    f"Bulk insert error at index {error['index']}: {error['errmsg']}"
+                )
+            inserted_ids = [
+                document["_id"]
+                for index, document in enumerate(data)
+                if index not in failed_indexes
+            ]
+            logger.info(f"Inserted {len(inserted_ids)} documents.")
+            return inserted_ids
         except errors.PyMongoError as e:
             logger.error(f"MongoDB error during insert: {e}")
             raise
@@ -91,6 +128,31 @@ class MongoDBHandler:
             logger.error(f"Unexpected error fetching data: {e}")
             raise
 
+    async def fetch_one(
+        self,
+        query: Dict[str, Any],
+        projection: Optional[Dict[str, Any]] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Fetch a single document matching a query asynchronously.
+
+        Args:
+            query (dict): MongoDB query filter.
+            projection (dict, optional): Fields to include or exclude.
+
+        Returns:
+            dict | None: The matching document, or None if not found.
+        """
+        try:
+            result = await self.collection.find_one(query, projection)
+            logger.info(f"Fetched document: {result is not None}.")
+            return result
+        except errors.PyMongoError as e:
+            logger.error(f"MongoDB error during fetch: {e}")
+            raise
+        except Exception as e:
+            logger.error(f"Unexpected error fetching data: {e}")
+            raise
+
     async def update_data(
         self, query: Dict[str, Any], new_values: Dict[str, Any]
     ) -> int:
@@ -140,6 +202,15 @@ class MongoDBHandler:
             logger.error(f"Unexpected error deleting data: {e}")
             raise
 
+    async def create_indexes(self) -> None:
+        """Create the unique `user_id` index used by single-user lookups."""
+        try:
+            await self.collection.create_index("user_id", unique=True)
+            logger.info("Ensured unique index on 'user_id'.")
+        except errors.PyMongoError as e:
+            logger.error(f"MongoDB error during index creation: {e}")
+            raise
+
     async def close_connection(self) -> None:
         """Close the MongoDB connection asynchronously."""
         try:
@@ -149,7 +220,7 @@ class MongoDBHandler:
             logger.error(f"Error closing connection: {e}")
             raise
 
-    async def _validate_document(self, document: Dict[str, Any]) -> None:
+    def _validate_document(self, document: Dict[str, Any]) -> None:
         """Ensure `user_id` is correctly structured.
 
         Args:
@@ -1,4 +1,5 @@
 import logging
+from typing import AsyncIterator
 from langchain_openai import ChatOpenAI
 
 
@@ -46,7 +47,27 @@ class OpenAILLM:
             str: The generated response from the model.
         """
         try:
-            return self.llm.invoke(prompt, **kwargs)
+            return await self.llm.ainvoke(prompt, **kwargs)
         except Exception as e:
             logging.error(f"OpenAI API request failed: {e}")
             raise ValueError(f"Failed to generate response from OpenAI: {e}")
+
+    async def stream_response(
+        self, prompt: str, **kwargs
+    ) -> AsyncIterator[str]:
+        """
+        Stream the response for the provided prompt as it is generated.
+
+        Args:
+            prompt (str): The prompt to send to the OpenAI API.
+            **kwargs: Any additional parameters to pass to the API call.
+
+        Yields:
+            str: The next piece of generated text.
+        """
+        try:
+            async for chunk in self.llm.astream(prompt, **kwargs):
+                yield chunk.content
+        except Exception as e:
+            logging.error(f"OpenAI API streaming request failed: {e}")
+            raise ValueError(f"Failed to stream response from OpenAI: {e}")
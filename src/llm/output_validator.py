@@ -6,6 +6,16 @@ logger = logging.getLogger(__name__)
 
 
 class RecipeValidator:
+    _REQUIRED_FIELDS = frozenset(
+        (
+            "name",
+            "ingredients",
+            "steps",
+            "cooking_time",
+            "difficulty_level",
+        )
+    )
+
     def __init__(
         self,
         available_ingredients: List[Dict[str, Any]],
@@ -49,6 +59,10 @@ class RecipeValidator:
         self.available_ingredients = available_ingredients
         self.disliked_ingredients = disliked_ingredients
         self.min_ingredients_required = min_ingredients_required
+        # The first pantry entry for a name wins, as in a linear search.
+        self._available_by_name: Dict[str, Dict[str, Any]] = {}
+        for ingredient in available_ingredients:
+            self._available_by_name.setdefault(ingredient["name"], ingredient)
 
     def validate_recipe_structure(self, recipe: Dict[str, Any]) -> bool:
         """
@@ -60,17 +74,12 @@ class RecipeValidator:
         Returns:
             bool: True if the recipe structure is valid, False otherwise.
         """
-        required_fields = [
-            "name",
-            "ingredients",
-            "steps",
-            "cooking_time",
-            "difficulty_level",
-        ]
-        for field in required_fields:
-            if field not in recipe:
-                logger.error(f"Recipe is missing required field: {field}")
-                return False
+        missing_fields = self._REQUIRED_FIELDS - recipe.keys()
+        if missing_fields:
+            logger.error(
+                f"Recipe is missing required fields: {sorted(missing_fields)}"
+            )
+            return False
         return True
 
     def validate_ingredient_quantities(
@@ -86,27 +95,12 @@ class RecipeValidator:
             bool: True if all ingredients are available in the required quantities, False otherwise.
         """
         for ingredient in ingredients:
-            ingredient_name = ingredient["name"]
-            required_quantity = ingredient["quantity"]
-
-            available_ingredient = next(
-                (
-                    item
-                    for item in self.available_ingredients
-                    if item["name"] == ingredient_name
-                ),
-                None,
-            )
-            if not available_ingredient:
-                continue
-
-            available_quantity = available_ingredient["quantity"]
-
-            if not self.is_quantity_sufficient(
-                required_quantity, available_quantity
-            ):
+            if not self._has_sufficient_quantity(ingredient):
+                available_quantity = self._available_by_name[
+                    ingredient["name"]
+                ]["quantity"]
                 logger.error(
-                    f"Ingredient '{ingredient_name}' has insufficient quantity. Required: {required_quantity}, Available: {available_quantity}"
+                    f"Ingredient '{ingredient['name']}' has insufficient quantity. Required: {ingredient['quantity']}, Available: {available_quantity}"
                 )
                 return False
 
@@ -144,16 +138,15 @@ class RecipeValidator:
         Returns:
             bool: True if the recipe makes culinary sense, False otherwise.
         """
-        if len(ingredients) < self.min_ingredients_required:
+        if not self._has_enough_ingredients(ingredients):
             logger.error(
                 f"Recipe contains fewer than {self.min_ingredients_required} ingredients."
             )
             return False
 
+        steps_text = self._steps_text(steps)
         for ingredient in ingredients:
-            if not any(
-                ingredient["name"].lower() in step.lower() for step in steps
-            ):
+            if not self._is_mentioned(ingredient["name"], steps_text):
                 logger.error(
                     f"Ingredient '{ingredient['name']}' is not mentioned in the steps."
                 )
@@ -175,23 +168,106 @@ class RecipeValidator:
         """
         valid_recipes = []
         for recipe_key, recipe in recipes.items():
-            if not self.validate_recipe_structure(recipe):
-                logger.error(f"Recipe {recipe_key} structure is invalid.")
-                continue
+            if self._validate_one(recipe_key, recipe):
+                valid_recipes.append(recipe)
+
+        return valid_recipes
+
+    def _validate_one(self, recipe_key: str, recipe: Dict[str, Any]) -> bool:
+        """
+        Runs the structure, quantity and culinary checks for one recipe in a
+        single pass over its ingredients.
+
+        Args:
+            recipe_key (str): The key identifying the recipe, used in logs.
+            recipe (dict): The recipe data.
+
+        Returns:
+            bool: True if the recipe passes every check, False otherwise.
+        """
+        if not self.validate_recipe_structure(recipe):
+            logger.error(f"Recipe {recipe_key} structure is invalid.")
+            return False
 
-            if not self.validate_ingredient_quantities(recipe["ingredients"]):
+        ingredients = recipe["ingredients"]
+        if not self._has_enough_ingredients(ingredients):
+            logger.error(
+                f"Recipe {recipe_key} contains fewer than {self.min_ingredients_required} ingredients."
+            )
+            return False
+
+        steps_text = self._steps_text(recipe["steps"])
+        for ingredient in ingredients:
+            ingredient_name = ingredient["name"]
+            if not self._has_sufficient_quantity(ingredient):
                 logger.error(
-                    f"Recipe {recipe_key} contains unavailable ingredients."
+                    f"Recipe {recipe_key} contains unavailable ingredients: '{ingredient_name}' has insufficient quantity."
                 )
-                continue
+                return False
 
-            if not self.validate_culinary_sense(
-                recipe["ingredients"], recipe["steps"]
-            ):
+            if not self._is_mentioned(ingredient_name, steps_text):
                 logger.error(
-                    f"Recipe {recipe_key} does not make culinary sense."
+                    f"Recipe {recipe_key} does not make culinary sense: '{ingredient_name}' is not mentioned in the steps."
                 )
-                continue
-            valid_recipes.append(recipe)
+                return False
 
-        return valid_recipes
+        return True
+
+    def _has_enough_ingredients(
+        self, ingredients: List[Dict[str, Any]]
+    ) -> bool:
+        """
+        Checks that a recipe uses at least the minimum number of ingredients.
+
+        Args:
+            ingredients (list): Ingredients listed in the recipe.
+
+        Returns:
+            bool: True if there are enough ingredients, False otherwise.
+        """
+        return len(ingredients) >= self.min_ingredients_required
+
+    def _has_sufficient_quantity(self, ingredient: Dict[str, Any]) -> bool:
+        """
+        Checks one recipe ingredient against the available quantity.
+        Ingredients that are not in the pantry are not quantity-checked.
+
+        Args:
+            ingredient (dict): A recipe ingredient with its required quantity.
+
+        Returns:
+            bool: True if the available quantity is sufficient, False otherwise.
+        """
+        available_ingredient = self._available_by_name.get(ingredient["name"])
+        if not available_ingredient:
+            return True
+        return self.is_quantity_sufficient(
+            ingredient["quantity"], available_ingredient["quantity"]
+        )
+
+    @staticmethod
+    def _steps_text(steps: List[str]) -> str:
+        """
+        Lowercases the steps once into a single searchable text.
+
+        Args:
+            steps (list): Steps listed in the recipe.
+
+        Returns:
+            str: The lowercased steps joined by newlines.
+        """
+        return "\n".join(step.lower() for step in steps)
+
+    @staticmethod
+    def _is_mentioned(name: str, steps_text: str) -> bool:
+        """
+        Checks whether an ingredient is mentioned in the steps.
+
+        Args:
+            name (str): The ingredient name.
+            steps_text (str): The lowercased steps from `_steps_text`.
+
+        Returns:
+            bool: True if the ingredient appears in the steps, False otherwise.
+        """
+        return name.lower() in steps_text
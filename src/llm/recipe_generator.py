@@ -1,10 +1,28 @@
+import asyncio
 import logging
-from typing import List
-from src.schemas.recipes_schemas import Recipe
+import string
+from typing import AsyncIterator, Dict, List, Set
+from langchain_core.prompts import PromptTemplate
+from pydantic import StrictStr, TypeAdapter, ValidationError
+from src.llm.stream_parser import IncrementalJsonParser
+from src.schemas.recipes_schemas import Recipe, RecipeCollection
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Recipes sit two levels deep: {"recipes": {"recipe_1": {...}}}.
+RECIPE_DEPTH = 2
+
+_STRING_LIST_ADAPTER = TypeAdapter(List[StrictStr])
+
+
+def _all_strings(values: List[str]) -> bool:
+    """Checks in pydantic-core that every value is a string."""
+    try:
+        _STRING_LIST_ADAPTER.validate_python(values)
+    except ValidationError:
+        return False
+    return True
+
 
 class RecipeGenerator:
     def __init__(self, llm, parser, prompt_template):
@@ -13,8 +31,9 @@ class RecipeGenerator:
 
         Args:
             llm (LLM): The LLM interface for generating responses.
-            parser (RecipeParser): The parser for converting response text into Recipe objects.
-            prompt_template (str): The template for formatting the prompt.
+            parser (RecipeParser): The parser providing the output format instructions.
+            prompt_template (PromptTemplate | str): The template for formatting
+                the prompt.
         """
         if not llm:
             raise ValueError("LLM must be provided")
@@ -26,13 +45,20 @@ class RecipeGenerator:
         self.llm = llm
         self.parser = parser
         self.prompt_template = prompt_template
+        self._prompt_fn = self._compile_prompt(prompt_template)
+        # Templates with the instructions inlined never ask the parser.
+        self._format_kwargs = (
+            {"format_instructions": parser.get_format_instructions()}
+            if "format_instructions" in self._template_fields(prompt_template)
+            else {}
+        )
 
     async def generate_recipes(
         self,
         ingredients: List[str],
         liked_ingredients: List[str],
         disliked_ingredients: List[str],
-    ) -> List[Recipe]:
+    ) -> RecipeCollection:
         """
         Generates structured recipes based on user preferences.
 
@@ -42,7 +68,8 @@ class RecipeGenerator:
             disliked_ingredients (List[str]): List of disliked ingredients.
 
         Returns:
-            List[Recipe]: List of generated recipes.
+            RecipeCollection: The generated recipes, empty if the LLM call
+            fails or its output is not a valid recipe collection.
         """
         self._validate_ingredients(
             ingredients, liked_ingredients, disliked_ingredients
@@ -55,9 +82,82 @@ class RecipeGenerator:
         try:
             response_text = await self._invoke_llm(prompt_text)
             return await self._parse_recipes(response_text)
-        except Exception as e:
-            logger.error(f"Error generating recipes: {e}")
-            return []
+        except ValueError as e:
+            logger.error("Error generating recipes: %s", e)
+            return RecipeCollection(recipes={})
+
+    async def generate_recipes_batch(
+        self,
+        requests: List[Dict[str, List[str]]],
+        *,
+        concurrency: int = 8,
+    ) -> List[RecipeCollection]:
+        """
+        Generates recipes for several requests concurrently, keeping at most
+        `concurrency` LLM calls in flight to respect rate limits.
+
+        Args:
+            requests (List[Dict[str, List[str]]]): Keyword arguments for
+                `generate_recipes`, one dict per request.
+            concurrency (int): Maximum number of concurrent LLM calls.
+
+        Returns:
+            List[RecipeCollection]: The results, in the order of `requests`.
+        """
+        if not isinstance(concurrency, int) or concurrency <= 0:
+            raise ValueError("concurrency must be a positive integer")
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def generate(request: Dict[str, List[str]]) -> RecipeCollection:
+            async with semaphore:
+                return await self.generate_recipes(**request)
+
+        return await asyncio.gather(
+            *(generate(request) for request in requests)
+        )
+
+    async def stream_recipes(
+        self,
+        ingredients: List[str],
+        liked_ingredients: List[str],
+        disliked_ingredients: List[str],
+    ) -> AsyncIterator[Recipe]:
+        """
+        Streams structured recipes, yielding each one as soon as its JSON
+        object has been received, so parsing overlaps with generation.
+
+        Args:
+            ingredients (List[str]): List of available ingredients.
+            liked_ingredients (List[str]): List of liked ingredients.
+            disliked_ingredients (List[str]): List of disliked ingredients.
+
+        Yields:
+            Recipe: The next complete recipe.
+        """
+        self._validate_ingredients(
+            ingredients, liked_ingredients, disliked_ingredients
+        )
+
+        prompt_text = self._format_prompt(
+            ingredients, liked_ingredients, disliked_ingredients
+        )
+
+        json_parser = IncrementalJsonParser(depth=RECIPE_DEPTH)
+        async for chunk in self.llm.stream_response(prompt_text):
+            for recipe_json in json_parser.feed(chunk):
+                try:
+                    yield Recipe.model_validate_json(recipe_json)
+                except ValidationError as e:
+                    logger.error("Skipping malformed recipe: %s", e)
+
+        if not json_parser.started:
+            logger.warning("LLM response contained no JSON.")
+        elif not json_parser.complete:
+            logger.warning(
+                "LLM response ended before its JSON was closed; "
+                "the output was probably truncated."
+            )
 
     def _format_prompt(
         self,
@@ -66,7 +166,9 @@ class RecipeGenerator:
         disliked_ingredients: List[str],
     ) -> str:
         """
-        Formats the prompt with provided ingredients and preferences.
+        Formats the prompt with provided ingredients and preferences. Lists
+        are joined into comma-separated text rather than rendered through
+        their repr.
 
         Args:
             available_ingredients (List[str]): List of available ingredients.
@@ -76,13 +178,53 @@ class RecipeGenerator:
         Returns:
             str: Formatted prompt string.
         """
-        return self.prompt_template.format(
-            available_ingredients=available_ingredients,
-            liked_ingredients=liked_ingredients,
-            disliked_ingredients=disliked_ingredients,
-            format_instructions=self.parser.get_format_instructions(),
+        return self._prompt_fn(
+            available_ingredients=", ".join(available_ingredients) or "none",
+            liked_ingredients=", ".join(liked_ingredients) or "none",
+            disliked_ingredients=", ".join(disliked_ingredients) or "none",
+            **self._format_kwargs,
         )
 
+    @staticmethod
+    def _compile_prompt(prompt_template):
+        """
+        Resolves the prompt template to a plain formatting function once, so
+        rendering a prompt is a single str.format call.
+
+        Args:
+            prompt_template (PromptTemplate | str): The prompt template.
+
+        Returns:
+            Callable[..., str]: Function rendering the prompt from keyword
+            arguments.
+        """
+        if (
+            isinstance(prompt_template, PromptTemplate)
+            and prompt_template.template_format == "f-string"
+            and not prompt_template.partial_variables
+        ):
+            return prompt_template.template.format
+        return prompt_template.format
+
+    @staticmethod
+    def _template_fields(prompt_template) -> Set[str]:
+        """
+        Lists the variables the prompt template expects.
+
+        Args:
+            prompt_template (PromptTemplate | str): The prompt template.
+
+        Returns:
+            Set[str]: The names of the template's input variables.
+        """
+        if isinstance(prompt_template, PromptTemplate):
+            return set(prompt_template.input_variables)
+        return {
+            field
+            for _, field, _, _ in string.Formatter().parse(prompt_template)
+            if field
+        }
+
     async def _invoke_llm(self, prompt_text: str) -> str:
         """
         Invokes the LLM and retrieves the response.
@@ -92,38 +234,33 @@ class RecipeGenerator:
 
         Returns:
             str: The response text from the LLM.
+
+        Raises:
+            ValueError: If the LLM request fails.
         """
-        try:
-            response = await self.llm.generate_response(prompt_text)
-            return (
-                response.content
-                if hasattr(response, "content")
-                else str(response)
-            )
-        except AttributeError as e:
-            logger.error(f"Invalid response from LLM: {e}")
-            raise ValueError(
-                "LLM response does not have expected 'content' attribute"
-            )
-        except Exception as e:
-            logger.error(f"Error invoking LLM: {e}")
-            raise ValueError("Error invoking LLM")
+        response = await self.llm.generate_response(prompt_text)
+        return (
+            response.content if hasattr(response, "content") else str(response)
+        )
 
-    async def _parse_recipes(self, response_text: str) -> List[Recipe]:
+    async def _parse_recipes(self, response_text: str) -> RecipeCollection:
         """
-        Parses the LLM response into a list of Recipe objects.
+        Parses the LLM response straight from JSON into a RecipeCollection.
+        Any text around the JSON object, such as a markdown code fence, is
+        ignored.
 
         Args:
             response_text (str): The raw response text from the LLM.
 
         Returns:
-            List[Recipe]: List of parsed Recipe objects.
+            RecipeCollection: The parsed recipes.
+
+        Raises:
+            ValidationError: If the response is not a valid recipe collection.
         """
-        try:
-            return self.parser.parse(response_text)
-        except Exception as e:
-            logger.error(f"Error parsing response: {e}")
-            return []
+        start = response_text.find("{")
+        end = response_text.rfind("}") + 1
+        return RecipeCollection.model_validate_json(response_text[start:end])
 
     def _validate_ingredients(
         self,
@@ -142,15 +279,11 @@ class RecipeGenerator:
         Raises:
             ValueError: If any of the ingredients lists are invalid.
         """
-        if not all(isinstance(ingredient, str) for ingredient in ingredients):
+        if not _all_strings(ingredients):
             raise ValueError("All ingredients must be strings")
-        if not all(
-            isinstance(ingredient, str) for ingredient in liked_ingredients
-        ):
+        if not _all_strings(liked_ingredients):
             raise ValueError("All liked ingredients must be strings")
-        if not all(
-            isinstance(ingredient, str) for ingredient in disliked_ingredients
-        ):
+        if not _all_strings(disliked_ingredients):
             raise ValueError("All disliked ingredients must be strings")
 
         if not ingredients:
@@ -0,0 +1,98 @@
+import re
+from typing import List
+
+
+class IncrementalJsonParser:
+    """Extracts complete JSON objects from a stream of text chunks.
+
+    Only objects that open at the given nesting ``depth`` (the number of
+    enclosing brackets) are returned, as raw JSON strings, as soon as their
+    closing brace arrives. Each character of the stream is scanned once.
+    """
+
+    _SPECIAL_CHARS = re.compile(r'[{}\[\]"\\]')
+    _JSON_START = re.compile(r"[{\[]")
+
+    def __init__(self, depth: int):
+        """
+        Initializes the parser state.
+
+        Args:
+            depth (int): Nesting depth of the objects to extract, e.g. 2 for
+                the values of {"recipes": {"recipe_1": {...}}}.
+        """
+        if not isinstance(depth, int) or depth < 0:
+            raise ValueError("depth must be a non-negative integer.")
+
+        self.depth = depth
+        self._level = 0
+        self._in_string = False
+        self._escaped_at = -1
+        self._offset = 0
+        self._parts: List[str] = []
+        self._capturing = False
+        self._started = False
+
+    def feed(self, chunk: str) -> List[str]:
+        """
+        Consumes the next chunk of the stream.
+
+        Args:
+            chunk (str): The next piece of streamed text.
+
+        Returns:
+            List[str]: The JSON objects completed within this chunk.
+        """
+        completed = []
+        start = 0
+        scan_from = 0
+        if not self._started:
+            # Text before the first bracket, quotes included, is not JSON.
+            first = self._JSON_START.search(chunk)
+            if first is None:
+                self._offset += len(chunk)
+                return completed
+            self._started = True
+            scan_from = first.start()
+
+        for match in self._SPECIAL_CHARS.finditer(chunk, scan_from):
+            index = match.start()
+            if self._offset + index == self._escaped_at:
+                continue
+
+            char = match.group()
+            if self._in_string:
+                if char == "\\":
+                    self._escaped_at = self._offset + index + 1
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = True
+            elif char in "{[":
+                if char == "{" and self._level == self.depth:
+                    self._capturing = True
+                    start = index
+                self._level += 1
+            elif char in "}]":
+                self._level -= 1
+                if self._capturing and self._level == self.depth:
+                    end = index + 1
+                    self._parts.append(chunk[start:end])
+                    completed.append("".join(self._parts))
+                    self._parts = []
+                    self._capturing = False
+
+        if self._capturing:
+            self._parts.append(chunk[start:])
+        self._offset += len(chunk)
+        return completed
+
+    @property
+    def started(self) -> bool:
+        """Whether any JSON object or array has been opened yet."""
+        return self._started
+
+    @property
+    def complete(self) -> bool:
+        """Whether JSON was received and everything opened has been closed."""
+        return self._started and self._level == 0 and not self._in_string
@@ -1,8 +1,24 @@
-from pydantic import BaseModel, Field
-from typing import List, Optional
+from __future__ import annotations
+
+import sys
+from typing import Any
+
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    computed_field,
+    field_validator,
+    model_validator,
+)
+
+# Derived from `ingredients` and included in UserPreferences dumps.
+_COMPUTED_FIELDS = frozenset(("liked_ingredients", "disliked_ingredients"))
 
 
 class Ingredient(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     name: str = Field(
         ..., description="Name of the ingredient (e.g., 'tomato')"
     )
@@ -11,27 +27,75 @@ class Ingredient(BaseModel):
         description="User's preference for this ingredient (True if liked, False if disliked)",
     )
 
+    @field_validator("name", mode="after")
+    @classmethod
+    def intern_name(cls, value: str) -> str:
+        """Interns the name so repeated ingredients share one string."""
+        return sys.intern(value)
+
 
 class AvailableIngredient(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     name: str = Field(
         ..., description="Name of the available ingredient (e.g., 'flour')"
     )
     quantity: str = Field(
         ..., description="Quantity of the ingredient (e.g., '2', '1.5')"
     )
-    unit: Optional[str] = Field(
+    unit: str | None = Field(
         None,
         description="Unit of measurement for the ingredient (e.g., 'kg', 'cups')",
     )
 
+    @field_validator("name", mode="after")
+    @classmethod
+    def intern_name(cls, value: str) -> str:
+        """Interns the name so repeated ingredients share one string."""
+        return sys.intern(value)
+
 
 class UserPreferences(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     user_id: str = Field(..., description="Unique identifier for the user")
     client_name: str = Field(..., description="Name of the client")
-    ingredients: List[Ingredient] = Field(
+    ingredients: list[Ingredient] = Field(
         ..., description="List of ingredients that the user likes/dislikes"
     )
-    available_ingredients: List[AvailableIngredient] = Field(
+    available_ingredients: list[AvailableIngredient] = Field(
         ...,
         description="List of available ingredients along with their quantities and units",
     )
+
+    @model_validator(mode="before")
+    @classmethod
+    def drop_computed_fields(cls, data: Any) -> Any:
+        """Accepts a dumped model by dropping its derived name lists."""
+        if isinstance(data, dict) and not _COMPUTED_FIELDS.isdisjoint(data):
+            return {
+                key: value
+                for key, value in data.items()
+                if key not in _COMPUTED_FIELDS
+            }
+        return data
+
+    @computed_field
+    @property
+    def liked_ingredients(self) -> list[str]:
+        """Names of the ingredients the user likes."""
+        return [
+            ingredient.name
+            for ingredient in self.ingredients
+            if ingredient.like
+        ]
+
+    @computed_field
+    @property
+    def disliked_ingredients(self) -> list[str]:
+        """Names of the ingredients the user dislikes."""
+        return [
+            ingredient.name
+            for ingredient in self.ingredients
+            if not ingredient.like
+        ]
@@ -1,18 +1,30 @@
 "Data schemas for Recipes"
 
-from typing import List, Dict
-from pydantic import BaseModel, Field
+from __future__ import annotations
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class RecipeIngredient(BaseModel):
+    """An ingredient used by a recipe."""
+
+    model_config = ConfigDict(frozen=True)
+
+    name: str = Field(..., description="Name of the ingredient")
+    quantity: str = Field(..., description="Quantity required by the recipe")
 
 
 class Recipe(BaseModel):
     """Represents a structured recipe."""
 
+    model_config = ConfigDict(frozen=True)
+
     name: str = Field(..., description="Name of the recipe")
-    ingredients: List[Dict[str, str]] = Field(
+    ingredients: list[RecipeIngredient] = Field(
         ...,
         description="List of ingredients with their quantities (name and quantity)",
     )
-    steps: List[str] = Field(
+    steps: list[str] = Field(
         ..., description="Step-by-step cooking instructions"
     )
     cooking_time: str = Field(..., description="Total cooking time")
@@ -24,10 +36,14 @@ class Recipe(BaseModel):
 class RecipeCollection(BaseModel):
     """Encapsulates multiple recipes, each with a unique key."""
 
-    recipes: Dict[str, Recipe] = Field(
+    model_config = ConfigDict(frozen=True)
+
+    recipes: dict[str, Recipe] = Field(
         ..., description="A dictionary mapping recipe keys to Recipe objects"
     )
 
 
 class UserRequest(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     user_id: str
@@ -0,0 +1,11 @@
+import asyncio
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+# IsolatedAsyncioTestCase builds each test's loop from the active policy.
+# Its loop_factory hook is only read from Python 3.13 onwards.
+if uvloop is not None:
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
@@ -1,5 +1,5 @@
 import unittest
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 from src.db.ingredient_manager import IngredientManager
 from src.schemas.ingredient_schemas import (
     Ingredient,
@@ -8,29 +8,26 @@ from src.schemas.ingredient_schemas import (
 )
 
 
-class TestIngredientManager(unittest.TestCase):
-    @classmethod
-    def setUpClass(cls):
-        """Setup mock database connection."""
-        cls.mock_client = MagicMock()
-        cls.mock_db = MagicMock()
-        cls.mock_collection = MagicMock()
+class TestIngredientManager(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        """Setup mock Motor collection."""
+        self.mock_collection = MagicMock()
+        self.mock_collection.create_index = AsyncMock()
+        self.mock_collection.update_one = AsyncMock()
+        self.mock_collection.find_one = AsyncMock()
+        self.mock_collection.delete_one = AsyncMock()
 
-        cls.mock_client.__getitem__.return_value = cls.mock_db
-        cls.mock_db.__getitem__.return_value = cls.mock_collection
+        self.manager = IngredientManager(self.mock_collection)
 
-        cls.manager = IngredientManager(
-            "mongodb://localhost:27017/", "test_database", "test_ingredients"
-        )
-
-        cls.manager.collection = cls.mock_collection
+    async def test_create_indexes(self):
+        """Test that the unique user_id index is created on demand."""
+        await self.manager.create_indexes()
 
-    @classmethod
-    def tearDownClass(cls):
-        """Clean up mocks."""
-        cls.mock_client.close()
+        self.mock_collection.create_index.assert_awaited_once_with(
+            "user_id", unique=True
+        )
 
-    def test_save_preferences(self):
+    async def test_save_preferences(self):
         """Test saving a user's ingredient preferences with mocked database."""
         data = UserPreferences(
             user_id="USR-12345",
@@ -51,7 +48,7 @@ class TestIngredientManager(unittest.TestCase):
             inserted_id="USR-12345"
         )
 
-        result = self.manager.save_preferences(data)
+        result = await self.manager.save_preferences(data)
 
         self.assertIn(
             result["status"], ["inserted", "updated"], "Unexpected save status"
@@ -71,7 +68,9 @@ class TestIngredientManager(unittest.TestCase):
         }
         self.mock_collection.find_one.return_value = saved_data_mock
 
-        saved_data = self.manager.collection.find_one({"user_id": "USR-12345"})
+        saved_data = await self.manager.collection.find_one(
+            {"user_id": "USR-12345"}
+        )
         self.assertIsNotNone(saved_data, "Data was not saved to the database")
         self.assertEqual(
             len(saved_data["ingredients"]),
@@ -84,7 +83,19 @@ class TestIngredientManager(unittest.TestCase):
             "Incorrect number of available ingredients saved",
         )
 
-    def test_conflicting_preferences(self):
+    async def test_get_preferences(self):
+        """Test retrieving the stored liked/disliked ingredient names."""
+        self.mock_collection.find_one.return_value = {
+            "liked_ingredients": ["onions"],
+            "disliked_ingredients": ["garlic"],
+        }
+
+        result = await self.manager.get_preferences("USR-12345")
+
+        self.assertEqual(result["liked_ingredients"], ["onions"])
+        self.assertEqual(result["disliked_ingredients"], ["garlic"])
+
+    async def test_conflicting_preferences(self):
         """Test that contradictory preferences are rejected with mocked database."""
         data = UserPreferences(
             user_id="USR-67890",
@@ -97,7 +108,7 @@ class TestIngredientManager(unittest.TestCase):
         )
 
         with self.assertRaises(ValueError) as context:
-            self.manager.save_preferences(data)
+            await self.manager.save_preferences(data)
 
         self.assertTrue(
             "Contradictory preference for ingredient: onions"
@@ -34,6 +34,13 @@ class TestUserModels(unittest.TestCase):
             Ingredient(**invalid_data)
         self.assertIn("Field required", str(context.exception))
 
+    def test_ingredient_names_are_interned(self):
+        first = Ingredient(name="".join(["Tom", "ato"]), like=True)
+        second = AvailableIngredient.model_validate_json(
+            '{"name": "Tomato", "quantity": "2"}'
+        )
+        self.assertIs(first.name, second.name)
+
     def test_valid_available_ingredient(self):
         available_ingredient = AvailableIngredient(
             **self.valid_available_ingredient
@@ -56,6 +63,29 @@ class TestUserModels(unittest.TestCase):
         self.assertEqual(len(preferences.ingredients), 1)
         self.assertEqual(len(preferences.available_ingredients), 1)
 
+    def test_user_preferences_splits_liked_and_disliked(self):
+        data = self.valid_user_preferences.copy()
+        data["ingredients"] = [
+            {"name": "Tomato", "like": True},
+            {"name": "Onion", "like": False},
+        ]
+        dumped = UserPreferences(**data).model_dump()
+        self.assertEqual(dumped["liked_ingredients"], ["Tomato"])
+        self.assertEqual(dumped["disliked_ingredients"], ["Onion"])
+
+    def test_user_preferences_round_trip(self):
+        preferences = UserPreferences(**self.valid_user_preferences)
+        self.assertEqual(
+            UserPreferences(**preferences.model_dump()), preferences
+        )
+
+    def test_invalid_user_preferences_extra_field(self):
+        invalid_data = self.valid_user_preferences.copy()
+        invalid_data["favourite_dish"] = "Lasagna"
+        with self.assertRaises(ValidationError) as context:
+            UserPreferences(**invalid_data)
+        self.assertIn("Extra inputs are not permitted", str(context.exception))
+
     def test_invalid_user_preferences_missing_user_id(self):
         invalid_data = self.valid_user_preferences.copy()
         del invalid_data["user_id"]
@@ -0,0 +1,206 @@
+import asyncio
+import itertools
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch, seal
+from bson import ObjectId
+from pymongo.errors import BulkWriteError, DuplicateKeyError
+from src.db.mongodb_handler import MongoDBHandler
+
+# Preallocated IDs handed out round-robin instead of generating new ones.
+_OID_POOL = tuple(ObjectId() for _ in range(16))
+_oid_iter = itertools.cycle(_OID_POOL)
+
+_ASYNC_METHODS = (
+    "insert_one",
+    "insert_many",
+    "find_one",
+    "update_many",
+    "delete_many",
+    "create_index",
+)
+
+
+class _FakeDB:
+    """Minimal stand-in for a Motor database."""
+
+    def __init__(self, collection):
+        self._collection = collection
+
+    def __getitem__(self, name):
+        return self._collection
+
+
+class _FakeClient:
+    """Minimal stand-in for AsyncIOMotorClient."""
+
+    def __init__(self, db):
+        self._db = db
+
+    def __getitem__(self, name):
+        return self._db
+
+
+class _Cursor:
+    """Minimal stand-in for a Motor cursor."""
+
+    def __init__(self, docs):
+        self._docs = docs
+
+    async def to_list(self, *args, **kwargs):
+        return self._docs
+
+
+class TestMongoDBHandler(unittest.IsolatedAsyncioTestCase):
+    @classmethod
+    def setUpClass(cls):
+        """Build the mock client tree and the handler once for all tests."""
+        super().setUpClass()
+        cls._mock_collection = MagicMock()
+        for method in _ASYNC_METHODS:
+            setattr(cls._mock_collection, method, AsyncMock())
+        cls._mock_collection.find = MagicMock()
+        # Only the methods above exist; anything else is a test bug.
+        seal(cls._mock_collection)
+
+        cls._fake_client = _FakeClient(_FakeDB(cls._mock_collection))
+
+        with patch(
+            "src.db.mongodb_handler.AsyncIOMotorClient",
+            return_value=cls._fake_client,
+        ):
+            cls._handler = MongoDBHandler(
+                "mongodb://localhost:27017", "test_db", "test_collection"
+            )
+
+    def setUp(self):
+        """Reset the cached mocks instead of rebuilding them."""
+        self.mock_collection = self._mock_collection
+        self.mock_collection.reset_mock(return_value=True, side_effect=True)
+        # Sealed mocks cannot create default return values on demand.
+        for method in _ASYNC_METHODS:
+            getattr(self.mock_collection, method).return_value = None
+        self.mock_collection.find.return_value = _Cursor([])
+        self.handler = self._handler
+        self.handler.collection = self.mock_collection
+
+    async def test_crud_mock_roundtrip(self):
+        """Test insert, fetch, update and delete against one mocked set-up."""
+        document = {"user_id": 123, "name": "John Doe"}
+        query = {"user_id": 123}
+        new_values = {"name": "Johnny"}
+        inserted_id = next(_oid_iter)
+        self.mock_collection.insert_one.return_value = MagicMock(
+            inserted_id=inserted_id
+        )
+        self.mock_collection.find.return_value = _Cursor([document])
+        self.mock_collection.update_many.return_value = MagicMock(
+            modified_count=1
+        )
+        self.mock_collection.delete_many.return_value = MagicMock(
+            deleted_count=1
+        )
+
+        results = await asyncio.gather(
+            self.handler.insert_data(document),
+            self.handler.fetch_data(query),
+            self.handler.update_data(query, new_values),
+            self.handler.delete_data(query),
+        )
+
+        self.assertEqual(tuple(results), (inserted_id, [document], 1, 1))
+        self.assertIs(
+            self.mock_collection.insert_one.await_args.args[0], document
+        )
+        self.assertIs(self.mock_collection.find.call_args.args[0], query)
+        update_args = self.mock_collection.update_many.await_args
+        self.assertIs(update_args.args[0], query)
+        self.assertIs(update_args.args[1]["$set"], new_values)
+        self.assertIs(
+            self.mock_collection.delete_many.await_args.args[0], query
+        )
+
+    async def test_insert_multiple_documents(self):
+        """Test inserting a batch of documents returns all their IDs."""
+        documents = [
+            {"user_id": 123, "name": "John Doe"},
+            {"user_id": 456, "name": "Jane Doe"},
+        ]
+        inserted_ids = [next(_oid_iter), next(_oid_iter)]
+        self.mock_collection.insert_many.return_value = MagicMock(
+            inserted_ids=inserted_ids
+        )
+
+        result = await self.handler.insert_data(documents)
+
+        self.assertEqual(result, inserted_ids)
+        self.assertEqual(set(map(type, result)), {ObjectId})
+        await_args = self.mock_collection.insert_many.await_args
+        self.assertIs(await_args.args[0], documents)
+        self.assertEqual(await_args.kwargs, {"ordered": False})
+
+    async def test_insert_duplicate_user_id(self):
+        """Test a duplicate user_id on a single insert raises ValueError."""
+        self.mock_collection.insert_one.side_effect = DuplicateKeyError(
+            "duplicate key"
+        )
+
+        with self.assertRaises(ValueError):
+            await self.handler.insert_data({"user_id": 123})
+
+    async def test_insert_multiple_documents_partial_failure(self):
+        """Test a batch with a duplicate returns only the written IDs."""
+        documents = [
+            {"_id": next(_oid_iter), "user_id": 123},
+            {"_id": next(_oid_iter), "user_id": 123},
+        ]
+        self.mock_collection.insert_many.side_effect = BulkWriteError(
+            {"writeErrors": [{"index": 1, "errmsg": "duplicate key"}]}
+        )
+
+        result = await self.handler.insert_data(documents)
+
+        self.assertEqual(result, [documents[0]["_id"]])
+
+    async def test_fetch_one(self):
+        """Test fetching a single document with a projection."""
+        query = {"user_id": 123}
+        projection = {"_id": 0}
+        document = {"user_id": 123, "name": "John Doe"}
+        self.mock_collection.find_one.return_value = document
+
+        result = await self.handler.fetch_one(query, projection)
+
+        self.assertEqual(result, document)
+        await_args = self.mock_collection.find_one.await_args
+        self.assertIs(await_args.args[0], query)
+        self.assertIs(await_args.args[1], projection)
+
+    async def test_update_data_empty_query(self):
+        """Test an empty update query is rejected."""
+        with self.assertRaises(ValueError):
+            await self.handler.update_data({}, {"name": "Johnny"})
+
+    async def test_delete_data_empty_query(self):
+        """Test an empty delete query is rejected."""
+        with self.assertRaises(ValueError):
+            await self.handler.delete_data({})
+
+    async def test_create_indexes(self):
+        """Test that the unique user_id index is created."""
+        await self.handler.create_indexes()
+
+        self.mock_collection.create_index.assert_awaited_once_with(
+            "user_id", unique=True
+        )
+
+    def test_validate_document_invalid_cases(self):
+        """Test documents without user_id are rejected."""
+        cases = [{"name": "John Doe"}, {}]
+        for document in cases:
+            with self.subTest(document=document):
+                with self.assertRaises(ValueError):
+                    self.handler._validate_document(document)
+
+
+if __name__ == "__main__":
+    unittest.main()
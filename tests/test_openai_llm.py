@@ -1,13 +1,38 @@
 import unittest
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 from pydantic import SecretStr
 from src.llm.openai_llm import OpenAILLM
 
+_API_KEY = SecretStr("dummy_api_key")
+
 
 class TestOpenAILLM(unittest.IsolatedAsyncioTestCase):
+    @classmethod
+    def setUpClass(cls):
+        """Patch ChatOpenAI construction and calls once for the whole class."""
+        super().setUpClass()
+        cls._init_patch = patch(
+            "src.llm.openai_llm.ChatOpenAI.__init__", return_value=None
+        )
+        cls._ainvoke_patch = patch("src.llm.openai_llm.ChatOpenAI.ainvoke")
+        cls._astream_patch = patch("src.llm.openai_llm.ChatOpenAI.astream")
+        cls.MockInit = cls._init_patch.start()
+        cls.MockInvoke = cls._ainvoke_patch.start()
+        cls.MockAstream = cls._astream_patch.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._astream_patch.stop()
+        cls._ainvoke_patch.stop()
+        cls._init_patch.stop()
+        super().tearDownClass()
+
     def setUp(self):
         """Set up the test environment before each test."""
-        self.api_key = SecretStr("dummy_api_key")
+        for mock in (self.MockInit, self.MockInvoke, self.MockAstream):
+            mock.reset_mock()
+            mock.side_effect = None
+        self.api_key = _API_KEY
         self.model_name = "gpt-3.5-turbo"
         self.temperature = 0.7
         self.max_tokens = 1000
@@ -18,42 +43,56 @@ class TestOpenAILLM(unittest.IsolatedAsyncioTestCase):
             max_tokens=self.max_tokens,
         )
 
-    @patch("src.llm.openai_llm.ChatOpenAI.__init__")
-    async def test_initialization(self, MockChatOpenAI_init):
+    def test_initialization(self):
         """Test that the OpenAILLM class is initialized correctly."""
-
-        MockChatOpenAI_init.return_value = None
-
-        openai_llm_instance = OpenAILLM(
-            model_name=self.model_name,
+        self.assertEqual(self.openai_llm.model_name, self.model_name)
+        self.assertEqual(self.openai_llm.temperature, self.temperature)
+        self.assertEqual(self.openai_llm.max_tokens, self.max_tokens)
+        self.assertEqual(
+            self.openai_llm.api_key.get_secret_value(), "dummy_api_key"
+        )
+        self.MockInit.assert_called_once_with(
+            model=self.model_name,
             api_key=self.api_key,
             temperature=self.temperature,
-            max_tokens=self.max_tokens,
+            max_completion_tokens=self.max_tokens,
         )
 
-        self.assertEqual(openai_llm_instance.model_name, self.model_name)
-        self.assertEqual(openai_llm_instance.temperature, self.temperature)
-        self.assertEqual(openai_llm_instance.max_tokens, self.max_tokens)
-        self.assertEqual(
-            openai_llm_instance.api_key.get_secret_value(), "dummy_api_key"
-        )
-
-    @patch("src.llm.openai_llm.ChatOpenAI.invoke")
-    async def test_generate_response_success(self, MockInvoke):
+    async def test_generate_response_success(self):
         """Test the generate_response method when OpenAI returns a successful response."""
-        MockInvoke.return_value = "Mocked response"
+        self.MockInvoke.return_value = "Mocked response"
         response = await self.openai_llm.generate_response("Hello!")
         self.assertEqual(response, "Mocked response")
-        MockInvoke.assert_called_once_with("Hello!", **{})
+        self.MockInvoke.assert_awaited_once_with("Hello!", **{})
 
-    @patch("src.llm.openai_llm.ChatOpenAI.invoke")
-    async def test_generate_response_failure(self, MockInvoke):
+    async def test_generate_response_failure(self):
         """Test the generate_response method when OpenAI fails (raises exception)."""
-        MockInvoke.side_effect = Exception("API error")
+        self.MockInvoke.side_effect = Exception("API error")
 
         with self.assertRaises(ValueError):
             await self.openai_llm.generate_response("Hire me, please!")
 
+    async def test_stream_response_success(self):
+        """Test the stream_response method yields each chunk's content."""
+
+        async def fake_stream(prompt, **kwargs):
+            for content in ("Hel", "lo!"):
+                yield MagicMock(content=content)
+
+        self.MockAstream.side_effect = fake_stream
+        chunks = [
+            chunk async for chunk in self.openai_llm.stream_response("Hi")
+        ]
+        self.assertEqual(chunks, ["Hel", "lo!"])
+
+    async def test_stream_response_failure(self):
+        """Test the stream_response method when OpenAI fails mid-stream."""
+        self.MockAstream.side_effect = Exception("API error")
+
+        with self.assertRaises(ValueError):
+            async for _ in self.openai_llm.stream_response("Hi"):
+                pass
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,21 +1,35 @@
 import unittest
 from src.llm.output_validator import RecipeValidator
 
+AVAILABLE_INGREDIENTS = [
+    {"name": "flour", "quantity": 500, "unit": "g"},
+    {"name": "sugar", "quantity": 200, "unit": "g"},
+    {"name": "butter", "quantity": 100, "unit": "g"},
+]
+DISLIKED_INGREDIENTS = ["egg"]
+MIN_INGREDIENTS_REQUIRED = 2
+
+# Read-only recipe inputs shared by several tests.
+_ING_FLOUR = ({"name": "flour", "quantity": 100, "unit": "g"},)
+_ING_FLOUR_BUTTER = _ING_FLOUR + (
+    {"name": "butter", "quantity": 100, "unit": "g"},
+)
+_STEPS_MIX_BAKE = ("Mix flour with butter and bake",)
+_STEPS_MIX_WATER_SUGAR = ("Mix water with sugar",)
 
-class TestRecipeValidator(unittest.TestCase):
-    def setUp(self):
-        self.available_ingredients = [
-            {"name": "flour", "quantity": 500, "unit": "g"},
-            {"name": "sugar", "quantity": 200, "unit": "g"},
-            {"name": "butter", "quantity": 100, "unit": "g"},
-        ]
-        self.disliked_ingredients = ["egg"]
-        self.min_ingredients_required = 2
 
-        self.recipe_validator = RecipeValidator(
-            self.available_ingredients,
-            self.disliked_ingredients,
-            self.min_ingredients_required,
+class TestRecipeValidator(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        """Build one validator shared by all tests; none of them mutate it."""
+        cls.available_ingredients = AVAILABLE_INGREDIENTS
+        cls.disliked_ingredients = DISLIKED_INGREDIENTS
+        cls.min_ingredients_required = MIN_INGREDIENTS_REQUIRED
+
+        cls.recipe_validator = RecipeValidator(
+            cls.available_ingredients,
+            cls.disliked_ingredients,
+            cls.min_ingredients_required,
         )
 
     def test_recipe_validator_initialization(self):
@@ -32,6 +46,15 @@ class TestRecipeValidator(unittest.TestCase):
             self.min_ingredients_required,
         )
 
+    def test_duplicate_available_ingredient_uses_first_entry(self):
+        validator = RecipeValidator(
+            [
+                {"name": "flour", "quantity": 50, "unit": "g"},
+                {"name": "flour", "quantity": 500, "unit": "g"},
+            ]
+        )
+        self.assertFalse(validator.validate_ingredient_quantities(_ING_FLOUR))
+
     def test_invalid_disliked_ingredients(self):
         with self.assertRaises(ValueError):
             RecipeValidator(self.available_ingredients, "egg")
@@ -68,57 +91,51 @@ class TestRecipeValidator(unittest.TestCase):
         result = self.recipe_validator.validate_recipe_structure(recipe)
         self.assertFalse(result)
 
-    def test_validate_ingredient_quantities_valid(self):
-        ingredients = [{"name": "flour", "quantity": 100, "unit": "g"}]
-        result = self.recipe_validator.validate_ingredient_quantities(
-            ingredients
-        )
-        self.assertTrue(result)
-
-    def test_validate_ingredient_quantities_invalid(self):
-        ingredients = [{"name": "flour", "quantity": 1000, "unit": "g"}]
-        result = self.recipe_validator.validate_ingredient_quantities(
-            ingredients
-        )
-        self.assertFalse(result)
-
-    def test_validate_culinary_sense_valid(self):
-        ingredients = [
-            {"name": "flour", "quantity": 100, "unit": "g"},
-            {"name": "butter", "quantity": 100, "unit": "g"},
+    def test_validate_ingredient_quantities(self):
+        cases = [
+            ("valid", _ING_FLOUR, True),
+            (
+                "invalid",
+                [{"name": "flour", "quantity": 1000, "unit": "g"}],
+                False,
+            ),
         ]
-        steps = ["Mix flour with butter and bake"]
-        result = self.recipe_validator.validate_culinary_sense(
-            ingredients, steps
-        )
-        self.assertTrue(result)
-
-    def test_validate_culinary_sense_invalid_not_enough_ingredients(self):
-        ingredients = [{"name": "flour", "quantity": 100, "unit": "g"}]
-        steps = ["Mix flour with water"]
-        validator = RecipeValidator(
-            self.available_ingredients, self.disliked_ingredients, 2
-        )
-        result = validator.validate_culinary_sense(ingredients, steps)
-        self.assertFalse(result)
-
-    def test_validate_culinary_sense_invalid_missing_ingredient_in_steps(self):
-        ingredients = [{"name": "flour", "quantity": 100, "unit": "g"}]
-        steps = ["Mix water with sugar"]
-        result = self.recipe_validator.validate_culinary_sense(
-            ingredients, steps
-        )
-        self.assertFalse(result)
+        for label, ingredients, expected in cases:
+            with self.subTest(label):
+                result = self.recipe_validator.validate_ingredient_quantities(
+                    ingredients
+                )
+                self.assertIs(result, expected)
+
+    def test_validate_culinary_sense(self):
+        cases = [
+            ("valid", _ING_FLOUR_BUTTER, _STEPS_MIX_BAKE, True),
+            (
+                "not enough ingredients",
+                _ING_FLOUR,
+                ("Mix flour with water",),
+                False,
+            ),
+            (
+                "missing ingredient in steps",
+                _ING_FLOUR,
+                _STEPS_MIX_WATER_SUGAR,
+                False,
+            ),
+        ]
+        for label, ingredients, steps, expected in cases:
+            with self.subTest(label):
+                result = self.recipe_validator.validate_culinary_sense(
+                    ingredients, steps
+                )
+                self.assertIs(result, expected)
 
     def test_validate_recipes_valid(self):
         recipes = {
             "recipe_1": {
                 "name": "Cake",
-                "ingredients": [
-                    {"name": "flour", "quantity": 100, "unit": "g"},
-                    {"name": "butter", "quantity": 100, "unit": "g"},
-                ],
-                "steps": ["Mix flour with butter and bake"],
+                "ingredients": _ING_FLOUR_BUTTER,
+                "steps": _STEPS_MIX_BAKE,
                 "cooking_time": "30 minutes",
                 "difficulty_level": "easy",
             }
@@ -127,13 +144,27 @@ class TestRecipeValidator(unittest.TestCase):
         self.assertEqual(len(valid_recipes), 1)
 
     def test_validate_recipes_invalid(self):
+        recipes = {
+            "recipe_1": {
+                "name": "Cake",
+                "ingredients": _ING_FLOUR,
+                "steps": _STEPS_MIX_WATER_SUGAR,
+                "cooking_time": "30 minutes",
+                "difficulty_level": "easy",
+            }
+        }
+        valid_recipes = self.recipe_validator.validate_recipes(recipes)
+        self.assertEqual(len(valid_recipes), 0)
+
+    def test_validate_recipes_insufficient_quantity(self):
         recipes = {
             "recipe_1": {
                 "name": "Cake",
                 "ingredients": [
-                    {"name": "flour", "quantity": 100, "unit": "g"}
+                    {"name": "flour", "quantity": 1000, "unit": "g"},
+                    {"name": "butter", "quantity": 100, "unit": "g"},
                 ],
-                "steps": ["Mix water with sugar"],
+                "steps": _STEPS_MIX_BAKE,
                 "cooking_time": "30 minutes",
                 "difficulty_level": "easy",
             }
@@ -0,0 +1,170 @@
+import asyncio
+import json
+import unittest
+from unittest.mock import AsyncMock, MagicMock
+from src.llm.prompts import RECIPE_PARSER, RECIPE_PROMPT
+from src.llm.recipe_generator import RecipeGenerator
+from src.schemas.recipes_schemas import Recipe, RecipeCollection
+
+
+class TestRecipeGenerator(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.recipe_data = {
+            "name": "Tomato Soup",
+            "ingredients": [
+                {"name": "tomato", "quantity": "2"},
+                {"name": "garlic", "quantity": "1"},
+            ],
+            "steps": ["Chop tomato and garlic.", "Simmer for 20 minutes."],
+            "cooking_time": "30 minutes",
+            "difficulty_level": "Easy",
+        }
+        self.response_text = json.dumps(
+            {"recipes": {"recipe_1": self.recipe_data}}
+        )
+        self.llm = MagicMock()
+        self.generator = RecipeGenerator(
+            self.llm, RECIPE_PARSER, RECIPE_PROMPT
+        )
+
+    async def test_generate_recipes(self):
+        self.llm.generate_response = AsyncMock(
+            return_value=MagicMock(
+                content=f"```json\n{self.response_text}\n```"
+            )
+        )
+
+        output = await self.generator.generate_recipes(
+            ["tomato (2)"], ["tomato"], ["onion"]
+        )
+
+        self.assertIsInstance(output, RecipeCollection)
+        self.assertEqual(output.recipes["recipe_1"].name, "Tomato Soup")
+
+    async def test_generate_recipes_invalid_response(self):
+        self.llm.generate_response = AsyncMock(
+            return_value=MagicMock(content="Sorry, I cannot help.")
+        )
+
+        output = await self.generator.generate_recipes(
+            ["tomato (2)"], ["tomato"], ["onion"]
+        )
+
+        self.assertEqual(output.recipes, {})
+
+    async def test_generate_recipes_unexpected_error_propagates(self):
+        self.llm.generate_response = AsyncMock(side_effect=RuntimeError("bug"))
+
+        with self.assertRaises(RuntimeError):
+            await self.generator.generate_recipes(
+                ["tomato (2)"], ["tomato"], ["onion"]
+            )
+
+    async def test_stream_recipes(self):
+        async def fake_stream(prompt):
+            for start in range(0, len(self.response_text), 16):
+                end = start + 16
+                yield self.response_text[start:end]
+
+        self.llm.stream_response = fake_stream
+
+        recipes = [
+            recipe
+            async for recipe in self.generator.stream_recipes(
+                ["tomato (2)"], ["tomato"], ["onion"]
+            )
+        ]
+
+        self.assertEqual(len(recipes), 1)
+        self.assertIsInstance(recipes[0], Recipe)
+        self.assertEqual(recipes[0].name, "Tomato Soup")
+
+    async def test_stream_recipes_empty_response(self):
+        async def fake_stream(prompt):
+            return
+            yield
+
+        self.llm.stream_response = fake_stream
+
+        with self.assertLogs(
+            "src.llm.recipe_generator", level="WARNING"
+        ) as logs:
+            recipes = [
+                recipe
+                async for recipe in self.generator.stream_recipes(
+                    ["tomato (2)"], ["tomato"], ["onion"]
+                )
+            ]
+
+        self.assertEqual(recipes, [])
+        self.assertIn("contained no JSON", logs.output[-1])
+
+    async def test_generate_recipes_batch(self):
+        in_flight = 0
+        max_in_flight = 0
+
+        async def fake_response(prompt):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return MagicMock(content=self.response_text)
+
+        self.llm.generate_response = fake_response
+        requests = [
+            {
+                "ingredients": ["tomato (2)"],
+                "liked_ingredients": ["tomato"],
+                "disliked_ingredients": ["onion"],
+            }
+        ] * 5
+
+        outputs = await self.generator.generate_recipes_batch(
+            requests, concurrency=2
+        )
+
+        self.assertEqual(len(outputs), 5)
+        self.assertTrue(all("recipe_1" in o.recipes for o in outputs))
+        self.assertEqual(max_in_flight, 2)
+
+    async def test_generate_recipes_batch_invalid_concurrency(self):
+        with self.assertRaises(ValueError):
+            await self.generator.generate_recipes_batch([], concurrency=0)
+
+    def test_format_prompt_matches_template(self):
+        expected = RECIPE_PROMPT.format(
+            available_ingredients="tomato (2), garlic (1)",
+            liked_ingredients="tomato",
+            disliked_ingredients="none",
+        )
+        prompt = self.generator._format_prompt(
+            ["tomato (2)", "garlic (1)"], ["tomato"], []
+        )
+        self.assertEqual(prompt, expected)
+
+    def test_format_prompt_with_format_instructions(self):
+        parser = MagicMock()
+        parser.get_format_instructions.return_value = "Reply in JSON."
+        generator = RecipeGenerator(
+            self.llm,
+            parser,
+            "Use {available_ingredients}. {format_instructions}",
+        )
+
+        prompt = generator._format_prompt(["tomato (2)"], [], [])
+
+        self.assertEqual(prompt, "Use tomato (2). Reply in JSON.")
+
+    def test_inlined_format_instructions_skip_parser(self):
+        parser = MagicMock()
+        RecipeGenerator(self.llm, parser, RECIPE_PROMPT)
+        parser.get_format_instructions.assert_not_called()
+
+    async def test_invalid_ingredients(self):
+        with self.assertRaises(ValueError):
+            await self.generator.generate_recipes([1], ["tomato"], ["onion"])
+
+
+if __name__ == "__main__":
+    unittest.main()
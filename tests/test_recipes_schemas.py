@@ -1,55 +1,89 @@
 import unittest
+import orjson
 from pydantic import ValidationError
-from src.schemas.recipes_schemas import Recipe, RecipeCollection, UserRequest
+from src.schemas.recipes_schemas import (
+    Recipe,
+    RecipeCollection,
+    RecipeIngredient,
+    UserRequest,
+)
+
+# Built once at import; tests treat it as read-only.
+_VALID_RECIPE_DATA = {
+    "name": "Pasta Carbonara",
+    "ingredients": [
+        {"name": "Spaghetti", "quantity": "200g"},
+        {"name": "Eggs", "quantity": "2"},
+        {"name": "Pancetta", "quantity": "100g"},
+        {"name": "Parmesan", "quantity": "50g"},
+    ],
+    "steps": [
+        "Boil water and cook spaghetti.",
+        "Fry pancetta until crispy.",
+        "Mix eggs and cheese together.",
+        "Combine everything and serve.",
+    ],
+    "cooking_time": "30 minutes",
+    "difficulty_level": "Medium",
+}
+_VALID_RECIPE_JSON = orjson.dumps(_VALID_RECIPE_DATA)
 
 
 class TestRecipeModels(unittest.TestCase):
-    def setUp(self):
-        self.valid_recipe_data = {
-            "name": "Pasta Carbonara",
-            "ingredients": [
-                {"name": "Spaghetti", "quantity": "200g"},
-                {"name": "Eggs", "quantity": "2"},
-                {"name": "Pancetta", "quantity": "100g"},
-                {"name": "Parmesan", "quantity": "50g"},
-            ],
-            "steps": [
-                "Boil water and cook spaghetti.",
-                "Fry pancetta until crispy.",
-                "Mix eggs and cheese together.",
-                "Combine everything and serve.",
-            ],
-            "cooking_time": "30 minutes",
-            "difficulty_level": "Medium",
-        }
-        self.valid_recipe_collection = {
-            "recipes": {"carbonara": self.valid_recipe_data}
+    @classmethod
+    def setUpClass(cls):
+        """Parse the canonical recipe once; the models are frozen."""
+        cls.valid_recipe_data = _VALID_RECIPE_DATA
+        cls.valid_recipe_collection = {
+            "recipes": {"carbonara": cls.valid_recipe_data}
         }
+        cls._valid_recipe = Recipe(**cls.valid_recipe_data)
+        cls._valid_collection = RecipeCollection(**cls.valid_recipe_collection)
 
     def test_valid_recipe(self):
-        recipe = Recipe(**self.valid_recipe_data)
+        recipe = self._valid_recipe
         self.assertEqual(recipe.name, "Pasta Carbonara")
         self.assertEqual(len(recipe.ingredients), 4)
         self.assertEqual(len(recipe.steps), 4)
         self.assertIsInstance(recipe.cooking_time, str)
         self.assertIsInstance(recipe.difficulty_level, str)
 
+    def test_valid_recipe_from_json(self):
+        recipe = Recipe.model_validate_json(_VALID_RECIPE_JSON)
+        self.assertEqual(recipe, self._valid_recipe)
+
     def test_invalid_recipe_missing_fields(self):
-        invalid_data = self.valid_recipe_data.copy()
-        del invalid_data["name"]
+        invalid_data = {
+            key: value
+            for key, value in self.valid_recipe_data.items()
+            if key != "name"
+        }
         with self.assertRaises(ValidationError) as context:
             Recipe(**invalid_data)
-        self.assertIn("Field required", str(context.exception))
+        self.assertEqual(context.exception.errors()[0]["type"], "missing")
 
     def test_invalid_recipe_wrong_type(self):
-        invalid_data = self.valid_recipe_data.copy()
-        invalid_data["cooking_time"] = 30
+        invalid_data = {**self.valid_recipe_data, "cooking_time": 30}
+        with self.assertRaises(ValidationError) as context:
+            Recipe(**invalid_data)
+        self.assertEqual(context.exception.errors()[0]["type"], "string_type")
+
+    def test_recipe_ingredients_are_typed(self):
+        recipe = self._valid_recipe
+        self.assertIsInstance(recipe.ingredients[0], RecipeIngredient)
+        self.assertEqual(recipe.ingredients[0].quantity, "200g")
+
+    def test_invalid_recipe_ingredient_missing_quantity(self):
+        invalid_data = {
+            **self.valid_recipe_data,
+            "ingredients": [{"name": "Spaghetti"}],
+        }
         with self.assertRaises(ValidationError) as context:
             Recipe(**invalid_data)
-        self.assertIn("Input should be a valid string", str(context.exception))
+        self.assertEqual(context.exception.errors()[0]["type"], "missing")
 
     def test_valid_recipe_collection(self):
-        collection = RecipeCollection(**self.valid_recipe_collection)
+        collection = self._valid_collection
         self.assertEqual(len(collection.recipes), 1)
         self.assertIn("carbonara", collection.recipes)
         self.assertIsInstance(collection.recipes["carbonara"], Recipe)
@@ -58,9 +92,7 @@ class TestRecipeModels(unittest.TestCase):
         invalid_collection = {"recipes": [self.valid_recipe_data]}
         with self.assertRaises(ValidationError) as context:
             RecipeCollection(**invalid_collection)
-        self.assertIn(
-            "Input should be a valid dictionary", str(context.exception)
-        )
+        self.assertEqual(context.exception.errors()[0]["type"], "dict_type")
 
     def test_valid_user_request(self):
         request = UserRequest(user_id="12345")
@@ -69,7 +101,7 @@ class TestRecipeModels(unittest.TestCase):
     def test_invalid_user_request_missing_user_id(self):
         with self.assertRaises(ValidationError) as context:
             UserRequest()
-        self.assertIn("Field required", str(context.exception))
+        self.assertEqual(context.exception.errors()[0]["type"], "missing")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,201 @@
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from pymongo.errors import DuplicateKeyError, ServerSelectionTimeoutError
+from src.api.routers import (
+    THREADED_VALIDATION_THRESHOLD,
+    app,
+    get_mongo_handler,
+    get_recipe_generator,
+    lifespan,
+)
+from src.schemas.recipes_schemas import Recipe
+
+
+class TestLifespan(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        """Patch the external clients created on startup."""
+        self.mongo_handler = MagicMock()
+        self.mongo_handler.create_indexes = AsyncMock()
+        self.mongo_handler.close_connection = AsyncMock()
+        for target, kwargs in (
+            ("get_settings", {}),
+            ("MongoDBHandler", {"return_value": self.mongo_handler}),
+            ("OpenAILLM", {}),
+        ):
+            patcher = patch(f"src.api.routers.{target}", **kwargs)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    async def test_index_failure_closes_connection(self):
+        """Test the Mongo client is closed when index creation fails."""
+        self.mongo_handler.create_indexes.side_effect = (
+            ServerSelectionTimeoutError("unreachable")
+        )
+
+        with self.assertRaises(ServerSelectionTimeoutError):
+            async with lifespan(FastAPI()):
+                pass
+
+        self.mongo_handler.close_connection.assert_awaited_once()
+
+    async def test_duplicate_user_ids_do_not_abort_startup(self):
+        """Test startup continues without the index on duplicate data."""
+        self.mongo_handler.create_indexes.side_effect = DuplicateKeyError(
+            "duplicate key"
+        )
+        test_app = FastAPI()
+
+        with self.assertLogs("src.api.routers", level="ERROR"):
+            async with lifespan(test_app):
+                self.assertTrue(hasattr(test_app.state, "recipe_generator"))
+
+        self.mongo_handler.close_connection.assert_awaited_once()
+
+
+class TestGenerateRecipesEndpoint(unittest.TestCase):
+    def setUp(self):
+        """Override the lifespan dependencies with mocks."""
+        self.mongo_handler = MagicMock()
+        self.mongo_handler.fetch_one = AsyncMock()
+        self.stream_calls = []
+        self.streamed_recipes = []
+
+        async def stream_recipes(ingredients, liked, disliked):
+            self.stream_calls.append((ingredients, liked, disliked))
+            for recipe in self.streamed_recipes:
+                yield recipe
+
+        self.recipe_generator = MagicMock()
+        self.recipe_generator.stream_recipes = stream_recipes
+
+        app.dependency_overrides[get_mongo_handler] = (
+            lambda: self.mongo_handler
+        )
+        app.dependency_overrides[get_recipe_generator] = (
+            lambda: self.recipe_generator
+        )
+        self.addCleanup(app.dependency_overrides.clear)
+        self.client = TestClient(app)
+
+    def test_generate_recipes_uses_stored_names(self):
+        """Test the stored liked/disliked names are passed to the LLM."""
+        self.mongo_handler.fetch_one.return_value = {
+            "available_ingredients": [
+                {"name": "flour", "quantity": "500", "unit": "g"}
+            ],
+            "liked_ingredients": ["tomato"],
+            "disliked_ingredients": [],
+        }
+
+        response = self.client.post(
+            "/generate_recipes/", json={"user_id": "USR-1"}
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            self.stream_calls, [(["flour (500)"], ["tomato"], [])]
+        )
+        self.mongo_handler.fetch_one.assert_awaited_once()
+        projection = self.mongo_handler.fetch_one.await_args.args[1]
+        self.assertNotIn("ingredients", projection)
+
+    def test_generate_recipes_old_document_shape(self):
+        """Test documents without the split name lists still work."""
+        self.mongo_handler.fetch_one.side_effect = [
+            {
+                "available_ingredients": [
+                    {"name": "flour", "quantity": "500", "unit": "g"}
+                ]
+            },
+            {
+                "ingredients": [
+                    {"name": "tomato", "like": True},
+                    {"name": "egg", "like": False},
+                ]
+            },
+        ]
+
+        response = self.client.post(
+            "/generate_recipes/", json={"user_id": "USR-1"}
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            self.stream_calls, [(["flour (500)"], ["tomato"], ["egg"])]
+        )
+        self.assertEqual(self.mongo_handler.fetch_one.await_count, 2)
+        projection = self.mongo_handler.fetch_one.await_args.args[1]
+        self.assertEqual(projection, {"_id": 0, "ingredients": 1})
+
+    def test_generate_recipes_returns_valid_recipe(self):
+        """Test a streamed recipe is validated and returned as JSON."""
+        recipe = Recipe(
+            name="Pancakes",
+            ingredients=[
+                {"name": "flour", "quantity": "200g"},
+                {"name": "egg", "quantity": "2"},
+                {"name": "milk", "quantity": "300ml"},
+            ],
+            steps=["Whisk the flour, egg and milk.", "Fry in a pan."],
+            cooking_time="20 minutes",
+            difficulty_level="Easy",
+        )
+        self.streamed_recipes = [recipe]
+        self.mongo_handler.fetch_one.return_value = {
+            "available_ingredients": [
+                {"name": "flour", "quantity": "500g", "unit": "g"},
+                {"name": "egg", "quantity": "6", "unit": "units"},
+                {"name": "milk", "quantity": "500ml", "unit": "ml"},
+            ],
+            "liked_ingredients": [],
+            "disliked_ingredients": [],
+        }
+
+        response = self.client.post(
+            "/generate_recipes/", json={"user_id": "USR-1"}
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {"recipes": [recipe.model_dump()]})
+
+    def test_generate_recipes_validates_large_batches_in_thread(self):
+        """Test batches over the threshold are validated off the loop."""
+        recipe = Recipe(
+            name="Bread",
+            ingredients=[
+                {"name": "flour", "quantity": "200g"},
+                {"name": "water", "quantity": "150ml"},
+                {"name": "salt", "quantity": "5g"},
+            ],
+            steps=["Knead the flour, water and salt.", "Bake."],
+            cooking_time="1 hour",
+            difficulty_level="Easy",
+        )
+        self.streamed_recipes = [recipe] * (THREADED_VALIDATION_THRESHOLD + 1)
+        self.mongo_handler.fetch_one.return_value = {
+            "available_ingredients": [
+                {"name": "flour", "quantity": "500g", "unit": "g"},
+                {"name": "water", "quantity": "900ml", "unit": "ml"},
+                {"name": "salt", "quantity": "8g", "unit": "g"},
+            ],
+            "liked_ingredients": [],
+            "disliked_ingredients": [],
+        }
+        to_thread = AsyncMock(side_effect=lambda func, *args: func(*args))
+
+        with patch("src.api.routers.asyncio.to_thread", to_thread):
+            response = self.client.post(
+                "/generate_recipes/", json={"user_id": "USR-1"}
+            )
+
+        self.assertEqual(response.status_code, 200)
+        to_thread.assert_awaited_once()
+        self.assertEqual(
+            len(response.json()["recipes"]), THREADED_VALIDATION_THRESHOLD + 1
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
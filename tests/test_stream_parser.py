@@ -0,0 +1,81 @@
+import json
+import unittest
+from src.llm.stream_parser import IncrementalJsonParser
+
+
+class TestIncrementalJsonParser(unittest.TestCase):
+    def setUp(self):
+        self.document = json.dumps(
+            {
+                "recipes": {
+                    "recipe_1": {"name": "Soup", "steps": ["Boil {water}"]},
+                    "recipe_2": {"name": 'Say "hi" \\ {', "steps": []},
+                }
+            }
+        )
+
+    def feed_in_chunks(self, parser, text, size):
+        completed = []
+        for start in range(0, len(text), size):
+            end = start + size
+            completed.extend(parser.feed(text[start:end]))
+        return completed
+
+    def test_extracts_objects_at_depth(self):
+        parser = IncrementalJsonParser(depth=2)
+        completed = parser.feed(self.document)
+        self.assertEqual(
+            [json.loads(item)["name"] for item in completed],
+            ["Soup", 'Say "hi" \\ {'],
+        )
+
+    def test_objects_split_across_chunks(self):
+        for size in (1, 2, 3, 7):
+            with self.subTest(size=size):
+                parser = IncrementalJsonParser(depth=2)
+                completed = self.feed_in_chunks(parser, self.document, size)
+                self.assertEqual(len(completed), 2)
+                self.assertEqual(json.loads(completed[0])["name"], "Soup")
+
+    def test_yields_object_before_stream_ends(self):
+        parser = IncrementalJsonParser(depth=2)
+        split = self.document.index("recipe_2")
+        self.assertEqual(len(parser.feed(self.document[:split])), 1)
+        self.assertEqual(len(parser.feed(self.document[split:])), 1)
+
+    def test_ignores_text_around_json(self):
+        parser = IncrementalJsonParser(depth=2)
+        completed = parser.feed("```json\n" + self.document + "\n```")
+        self.assertEqual(len(completed), 2)
+
+    def test_ignores_quotes_before_json(self):
+        text = "Here's your \"JSON:\n" + self.document
+        for size in (1, 5, len(text)):
+            with self.subTest(size=size):
+                parser = IncrementalJsonParser(depth=2)
+                completed = self.feed_in_chunks(parser, text, size)
+                self.assertEqual(len(completed), 2)
+                self.assertTrue(parser.complete)
+
+    def test_complete(self):
+        parser = IncrementalJsonParser(depth=2)
+        split = self.document.index("recipe_2")
+        parser.feed(self.document[:split])
+        self.assertFalse(parser.complete)
+        parser.feed(self.document[split:])
+        self.assertTrue(parser.complete)
+
+    def test_not_complete_without_json(self):
+        parser = IncrementalJsonParser(depth=2)
+        self.assertFalse(parser.complete)
+        parser.feed("Sorry, I cannot help with that.")
+        self.assertFalse(parser.started)
+        self.assertFalse(parser.complete)
+
+    def test_invalid_depth(self):
+        with self.assertRaises(ValueError):
+            IncrementalJsonParser(depth=-1)
+
+
+if __name__ == "__main__":
+    unittest.main()